@@ -1,21 +1,61 @@
+import errno
 import json
 import subprocess
 import os
 import sys
 import tkinter as tk
-from tkinter import ttk, Scrollbar, Checkbutton, BooleanVar, Button, Label, Entry, Text, filedialog, messagebox, Toplevel, StringVar
-from bs4 import BeautifulSoup
+from tkinter import ttk, Scrollbar, Button, Label, Entry, Text, filedialog, messagebox, Toplevel, StringVar
+from bs4 import BeautifulSoup, SoupStrainer
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
 import logging
+import shlex
 import shutil
+import stat
 import unicodedata
 import threading
 import queue
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import MappingProxyType
+
+# lxml is an optional, much faster C-based HTML parser. BeautifulSoup can use it directly;
+# if it isn't installed we fall back to Python's built-in (pure-Python) html.parser.
+try:
+    import lxml # noqa: F401 (only imported to check availability)
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# orjson is an optional, faster JSON library used for the settings file.
+# Falls back to the standard library json module if it isn't installed.
+# Both variants work on UTF-8 bytes, so the file is read/written in binary mode
+# without an extra str <-> bytes conversion step.
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        # orjson only supports 2-space indentation and always emits UTF-8 (no ASCII escaping)
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data) # Accepts bytes, detecting UTF-8 (with or without BOM)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=4, ensure_ascii=False).encode('utf-8')
 
 # --- Logging Setup ---
 # Using logging provides more flexibility than print (e.g., levels, output to file)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Dedicated logger for relaying SteamCMD's own output line by line. Being separate from the
+# root logger, it can be quietened on its own, e.g. logging.getLogger("steamcmd").setLevel(logging.WARNING).
+steamcmd_logger = logging.getLogger("steamcmd")
 
 # --- Global Settings ---
 # app_settings: Dictionary holding application settings, loaded from/saved to file.
@@ -24,9 +64,91 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 app_settings = {}
 # SETTINGS_FILE: Name of the JSON file used for persisting settings.
 SETTINGS_FILE = "settings.json"
+# STEAMCMD_BATCH_SIZE: Maximum number of mods downloaded per SteamCMD invocation (keeps argv under OS limits).
+STEAMCMD_BATCH_SIZE = 200
+# PROGRESS_UPDATE_INTERVAL: Minimum seconds between live SteamCMD output updates sent to the GUI (~30 Hz).
+PROGRESS_UPDATE_INTERVAL = 1 / 30
+# COPY_WORKERS: Mods copied concurrently when the temp download dir is on a different device than the
+#               install dir (same-device moves are instant renames and stay sequential).
+COPY_WORKERS = 4
+# MOD_LIST_CHUNK_SIZE: Rows inserted into the mod list per idle callback (the GUI redraws and handles input in between).
+MOD_LIST_CHUNK_SIZE = 200
+# SCRAPE_CACHE_TTL: Seconds a scraped URL result is reused before the page is fetched again.
+SCRAPE_CACHE_TTL = 300
+# SCRAPE_CACHE_MAX_ENTRIES: Maximum number of URLs kept in the scrape cache (least recently used evicted first).
+SCRAPE_CACHE_MAX_ENTRIES = 32
+# _scrape_cache: Maps URL -> (time.monotonic() when scraped, list of mod detail dicts).
+#                Relies on dict insertion order to track recency.
+_scrape_cache = {}
+# _steamcmd_exe_cache: ((steamcmd_path_setting, sys.platform), executable) from the last successful
+#                      SteamCMD lookup, or None. Changing the path in settings invalidates it.
+_steamcmd_exe_cache = None
+# _http_session: Shared HTTP session for scraping, so repeated fetches of steamcommunity.com reuse
+#                the pooled keep-alive connection (no new TCP + TLS handshake per page). Transient
+#                connection failures and 429/5xx gateway responses are retried with backoff.
+_http_session = requests.Session()
+_http_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10,
+                                            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504))))
+# _HOME / _DEFAULT_DL: User's home directory and the fallback initial directory for the install
+#                      folder dialog (~/Downloads if it exists, else home). Resolved once at import
+#                      so opening the dialog only has to stat the user-configured path.
+_HOME = os.path.expanduser("~")
+_DEFAULT_DL = os.path.join(_HOME, "Downloads")
+if not os.path.isdir(_DEFAULT_DL): _DEFAULT_DL = _HOME
+
+# --- Precompiled Patterns ---
+# Compiled once at import instead of on every scrape call / every mod container.
+# Container divs holding a single mod (e.g., 'workshopItem', 'collectionItem').
+_RE_CONTAINER = re.compile(r'(workshopItem|collectionItem)\b')
+# Title divs inside a container, matched case-insensitively.
+_RE_TITLE = re.compile(r'(workshopItemTitle|item_title|title)\b', re.IGNORECASE)
+# Workshop item links (relative or absolute) within a container.
+_RE_HREF = re.compile(r'/sharedfiles/filedetails/\?id=')
+# Absolute workshop item links, used by the broader fallback search.
+_RE_FULLURL = re.compile(r'https://steamcommunity\.com/sharedfiles/filedetails/\?id=')
+# Extracts the numeric mod ID from a workshop link.
+_RE_ID = re.compile(r'id=(\d+)')
+# Only <div> and <a> subtrees are ever inspected by the scraper, so don't build tree nodes for
+# anything else (<head>, top-level <script>/<style> blocks, etc.).
+_SCRAPE_STRAINER = SoupStrainer(['div', 'a'])
+# Characters (runs of them) invalid in Windows/Linux/macOS file and directory names, replaced by
+# sanitize_filename: \ / : * ? " < > | plus tab/newline-type whitespace.
+_RE_INVALID_PATH_CHARS = re.compile(r'[\\/:*?"<>|\t\n\r\f\v]+')
+# Remaining control characters, removed by sanitize_filename. Its ASCII conversion leaves only
+# code points <= 0x7F, where the control (Unicode category "C") characters are exactly these.
+_RE_CONTROL_CHARS = re.compile(r'[\x00-\x1f\x7f]')
+# Input validation in the GUI: an http(s) URL with at least one dot after the scheme...
+_RE_URL = re.compile(r'^https?://\S+\.\S+$')
+# ...and pasted text that starts like an HTML document (checked against the first bytes only).
+_RE_HTML = re.compile(r'^\s*<(?:html|!doctype)', re.IGNORECASE)
 
 # --- Utility Functions ---
 
+# Device names Windows reserves regardless of extension; sanitize_filename never returns one.
+_WINDOWS_RESERVED_NAMES = frozenset({
+    "CON", "PRN", "AUX", "NUL", "COM1", "COM2", "COM3", "COM4",
+    "COM5", "COM6", "COM7", "COM8", "COM9", "LPT1", "LPT2",
+    "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9"})
+
+# Translation table deleting the ASCII digits 0-9; see is_ascii_number().
+_DIGIT_DROP = str.maketrans('', '', '0123456789')
+
+def is_ascii_number(text):
+    """
+    Checks whether a string is a non-empty run of ASCII digits (e.g., an App ID).
+
+    Uses a precomputed translate table (a single C-level pass) rather than
+    str.isdigit(), which also accepts non-ASCII digits like '²' or '٣' that
+    SteamCMD would reject.
+
+    Args:
+        text (str): The string to check.
+
+    Returns:
+        bool: True if `text` consists only of the characters 0-9.
+    """
+    return bool(text) and not text.translate(_DIGIT_DROP)
+
 def sanitize_filename(name):
     """
     Sanitizes a string to create a valid directory name for common OSes.
@@ -48,25 +170,27 @@ def sanitize_filename(name):
         return "Unnamed Mod"
 
     try:
-        # Normalize unicode characters to their closest ASCII equivalent
-        name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+        # Normalize unicode characters to their closest ASCII equivalent. Pure-ASCII names (the
+        # common case) are already in that form, and the NFKD quick check skips re-normalizing
+        # strings that already are decomposed, leaving just the ASCII filter.
+        if not name.isascii():
+            if not unicodedata.is_normalized('NFKD', name):
+                name = unicodedata.normalize('NFKD', name)
+            name = name.encode('ascii', 'ignore').decode('ascii')
     except Exception:
         # Fallback if normalization fails (should be rare)
         name = "".join(c for c in name if c.isalnum() or c in (' ', '_', '-')).strip()
 
     # Replace invalid path characters with underscore
     # Invalid chars: \ / : * ? " < > | plus control characters
-    name = re.sub(r'[\\/:*?"<>|\t\n\r\f\v]+', '_', name)
-    name = "".join(c for c in name if unicodedata.category(c)[0] != "C") # Remove control chars
+    name = _RE_INVALID_PATH_CHARS.sub('_', name)
+    name = _RE_CONTROL_CHARS.sub('', name) # Remove control chars
 
     # Remove leading/trailing whitespace and dots, crucial for Windows validity
     name = name.strip('. ')
 
     # Prevent names reserved on Windows (case-insensitive check)
-    reserved_names = {"CON", "PRN", "AUX", "NUL", "COM1", "COM2", "COM3", "COM4",
-                      "COM5", "COM6", "COM7", "COM8", "COM9", "LPT1", "LPT2",
-                      "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9"}
-    if name.upper() in reserved_names:
+    if name.upper() in _WINDOWS_RESERVED_NAMES:
         name = name + "_mod" # Append suffix if reserved
 
     # Limit length to avoid potential path length issues
@@ -82,15 +206,19 @@ def sanitize_filename(name):
 
 # --- Settings Management ---
 
+# _DEFAULT_SETTINGS: Read-only fallback values used if the settings file is missing or invalid.
+#                    Built once at import; a mappingproxy so lookups can't accidentally mutate it.
+_DEFAULT_SETTINGS = MappingProxyType({
+    "steamcmd_path": "", # Empty string triggers auto-detect logic
+    "default_download_dir": "", # Empty string uses system default logic (e.g., ~/Downloads)
+    "app_id": "294100", # Default to RimWorld App ID as a common example
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36" # Standard UA
+})
+
 def get_default_settings():
-    """Returns a dictionary containing the default application settings."""
-    # These serve as fallback values if the settings file is missing or invalid.
-    return {
-        "steamcmd_path": "", # Empty string triggers auto-detect logic
-        "default_download_dir": "", # Empty string uses system default logic (e.g., ~/Downloads)
-        "app_id": "294100", # Default to RimWorld App ID as a common example
-        "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36" # Standard UA
-    }
+    """Returns a new, mutable dictionary containing the default application settings."""
+    # Callers that only need to read a default should use _DEFAULT_SETTINGS directly.
+    return _DEFAULT_SETTINGS.copy()
 
 def load_settings():
     """
@@ -100,20 +228,19 @@ def load_settings():
     Updates the global `app_settings` dictionary.
     """
     global app_settings
-    defaults = get_default_settings()
+    defaults = _DEFAULT_SETTINGS
     if os.path.exists(SETTINGS_FILE):
         try:
-            with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
+            with open(SETTINGS_FILE, 'rb') as f:
                 # Load JSON data, ensuring it's not empty
                 content = f.read()
                 if not content:
                     logging.warning(f"Settings file '{SETTINGS_FILE}' is empty. Using defaults.")
                     app_settings = defaults.copy()
                     return
-                loaded = json.loads(content)
+                loaded = _json_loads(content)
                 # Merge loaded settings with defaults to ensure all expected keys exist
-                app_settings = defaults.copy()
-                app_settings.update(loaded) # Overwrite defaults with loaded values
+                app_settings = {**defaults, **loaded} # Loaded values override defaults, in one step
                 logging.info(f"Settings loaded from {SETTINGS_FILE}")
         except (json.JSONDecodeError, IOError, TypeError) as e:
             # Handle potential errors during file reading or JSON parsing
@@ -135,9 +262,9 @@ def save_settings(settings_dict):
         settings_dict (dict): The dictionary containing settings to save.
     """
     try:
-        with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
-            # Use indent for readability, ensure_ascii=False for non-ASCII chars
-            json.dump(settings_dict, f, indent=4, ensure_ascii=False)
+        with open(SETTINGS_FILE, 'wb') as f:
+            # Indented for readability, non-ASCII chars written as-is
+            f.write(_json_dumps(settings_dict))
         logging.info(f"Settings saved to {SETTINGS_FILE}")
     except IOError as e:
         # Handle potential file writing errors
@@ -153,9 +280,11 @@ def open_settings_window(parent):
     Loads current settings into the fields and saves them back on confirmation.
     """
     settings_win = Toplevel(parent)
+    # Kept hidden while it's built and positioned, so it's laid out and drawn once, at its final
+    # size and place, instead of appearing at a default spot and then jumping over the parent.
+    settings_win.withdraw()
     settings_win.title("Settings")
     settings_win.transient(parent) # Keep on top of parent
-    settings_win.grab_set()      # Make modal (block interaction with parent)
     settings_win.resizable(False, False) # Fixed size is fine for settings
 
     # Tkinter variables linked to the Entry widgets for easy get/set
@@ -216,7 +345,7 @@ def open_settings_window(parent):
         global app_settings
         # Simple validation for App ID
         app_id_val = app_id_var.get().strip()
-        if app_id_val and not app_id_val.isdigit():
+        if app_id_val and not is_ascii_number(app_id_val):
             messagebox.showerror("Invalid Input", "App ID must be a number.", parent=settings_win)
             return # Keep window open
 
@@ -225,9 +354,9 @@ def open_settings_window(parent):
             "steamcmd_path": steamcmd_path_var.get().strip(),
             "default_download_dir": download_dir_var.get().strip(),
             # Use default if field is empty, otherwise use validated value
-            "app_id": app_id_val if app_id_val else get_default_settings()["app_id"],
+            "app_id": app_id_val if app_id_val else _DEFAULT_SETTINGS["app_id"],
             # Use default if field is empty, otherwise use entered value
-            "user_agent": user_agent_var.get().strip() or get_default_settings()["user_agent"]
+            "user_agent": user_agent_var.get().strip() or _DEFAULT_SETTINGS["user_agent"]
         }
         # Update the global dictionary and save to file
         app_settings.update(new_settings)
@@ -239,31 +368,50 @@ def open_settings_window(parent):
     ttk.Button(button_frame, text="Cancel", command=settings_win.destroy).pack(side="right")
 
     # --- Final Setup ---
-    # Attempt to configure the secondary label style (might fail depending on theme)
-    try:
-        style = ttk.Style()
-        style.configure("secondary.TLabel", foreground="grey") # Use grey for less emphasis
-    except tk.TclError:
-        logging.warning("Could not configure secondary label style (theme might not support it).")
-
     # Calculate position to center the settings window over the parent window
-    settings_win.update_idletasks() # Ensure window dimensions are calculated
+    settings_win.update_idletasks() # Single layout pass, so the requested size below is known
     parent_x = parent.winfo_rootx()
     parent_y = parent.winfo_rooty()
     parent_w = parent.winfo_width()
     parent_h = parent.winfo_height()
-    win_w = settings_win.winfo_width()
-    win_h = settings_win.winfo_height()
+    # Requested size: the actual size (winfo_width/height) is still 1x1 while the window is unmapped
+    win_w = settings_win.winfo_reqwidth()
+    win_h = settings_win.winfo_reqheight()
     # Calculate top-left corner coordinates for centering
     x = parent_x + (parent_w // 2) - (win_w // 2)
     y = parent_y + (parent_h // 2) - (win_h // 2)
     settings_win.geometry(f'+{x}+{y}') # Set window position
+    settings_win.deiconify() # Show it, already in place
+    settings_win.wait_visibility() # A grab needs a viewable window
+    settings_win.grab_set()      # Make modal (block interaction with parent)
 
     settings_win.wait_window() # Wait for the settings window to be closed before returning
 
 
 # --- Core Functions ---
 
+def _get_cached_scrape(url):
+    """
+    Returns a copy of the cached scrape result for `url`, or None if there is
+    no entry or it is older than SCRAPE_CACHE_TTL.
+    """
+    entry = _scrape_cache.pop(url, None)
+    if entry is None:
+        return None
+    scraped_at, mod_details = entry
+    if time.monotonic() - scraped_at > SCRAPE_CACHE_TTL:
+        return None # Expired; leave it evicted
+    _scrape_cache[url] = entry # Re-insert to mark as most recently used
+    # Hand out copies so callers can't mutate the cached entries
+    return [dict(mod) for mod in mod_details]
+
+def _store_cached_scrape(url, mod_details):
+    """Caches a copy of a successful scrape result for `url`, evicting the oldest entries if full."""
+    _scrape_cache.pop(url, None)
+    _scrape_cache[url] = (time.monotonic(), [dict(mod) for mod in mod_details])
+    while len(_scrape_cache) > SCRAPE_CACHE_MAX_ENTRIES:
+        del _scrape_cache[next(iter(_scrape_cache))] # First key is the least recently used
+
 def scrape_mod_details(source, source_type):
     """
     Scrapes mod IDs and names from a Steam Workshop URL or HTML source.
@@ -271,131 +419,337 @@ def scrape_mod_details(source, source_type):
     Prioritizes finding mods within specific container divs (e.g., 'workshopItem').
     Falls back to a broader link search if the primary strategy fails.
     Uses the User-Agent configured in settings. Handles duplicate mod IDs
-    by preferring entries where a proper name was found.
+    by preferring entries where a proper name was found. Successful URL
+    results are cached for SCRAPE_CACHE_TTL seconds, so reloading the same
+    URL doesn't fetch and parse the page again.
 
     Args:
         source (str): The URL or raw HTML content.
         source_type (str): 'url' or 'html'.
 
     Returns:
-        list: A list of dictionaries [{'id': mod_id, 'name': mod_name}],
-              sorted numerically by mod ID. Returns empty list on error.
-              Returns None if a fatal error occurred preventing normal return.
+        list | dict: A list of dictionaries [{'id': mod_id, 'name': mod_name}],
+              sorted numerically by mod ID. On error, a dict
+              {'error_title': str, 'error': str} describing the problem
+              (this function never shows dialogs itself; it runs off the GUI thread).
     """
-    # Using a dictionary keyed by mod_id ensures uniqueness and allows
-    # easily replacing placeholder names if a real name is found later.
-    mod_details_dict = {}
+    # Found mods are kept as parallel lists of IDs and names (cheaper than a dict entry per mod),
+    # plus an ID -> list index map that ensures uniqueness and allows easily replacing
+    # placeholder names if a real name is found later.
+    mod_ids = []
+    mod_names = []
+    id_index = {}
+    placeholder_prefix = "Name not found" # Constant for placeholder name start
+
+    def add_mod(mod_id, mod_name):
+        """Adds a mod, or replaces its placeholder name if a real one was found (shared by both strategies)."""
+        idx = id_index.get(mod_id)
+        # Add if new, OR update if the existing entry was just a placeholder and the new one isn't.
+        # This prioritizes keeping a real name once found.
+        if idx is None:
+            id_index[mod_id] = len(mod_ids)
+            mod_ids.append(mod_id)
+            mod_names.append(mod_name)
+        elif mod_names[idx].startswith(placeholder_prefix) and not mod_name.startswith(placeholder_prefix):
+            mod_names[idx] = mod_name
+
+    if source_type == 'url':
+        cached = _get_cached_scrape(source)
+        if cached is not None:
+            logging.info(f"Using cached results for URL: {source} ({len(cached)} mods)")
+            return cached
     try:
-        user_agent = app_settings.get("user_agent", get_default_settings()["user_agent"])
+        user_agent = app_settings.get("user_agent") or _DEFAULT_SETTINGS["user_agent"]
         headers = {'User-Agent': user_agent}
 
         if source_type == 'url':
             logging.info(f"Fetching URL: {source}")
             # Added timeout to prevent indefinite hanging on network issues
-            response = requests.get(source, headers=headers, timeout=15)
-            response.raise_for_status() # Check for HTTP errors (4xx/5xx)
-            html_content = response.text
+            # The context manager releases the connection as soon as the body has been read.
+            with _http_session.get(source, headers=headers, timeout=15) as response:
+                response.raise_for_status() # Check for HTTP errors (4xx/5xx)
+                # Keep the raw bytes and let the parser decode them, so we never hold a second,
+                # decoded str copy of a large page. Steam Community pages are always UTF-8, so
+                # say so up front instead of having the encoding sniffed/guessed.
+                html_content = response.content
+                html_encoding = 'utf-8'
         elif source_type == 'html':
             html_content = source
+            html_encoding = None # Already a str; nothing to decode
         else:
             # This should ideally not be reached if input validation is done, but belt-and-suspenders.
             raise ValueError("Invalid source_type provided to scrape_mod_details.")
 
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=_SCRAPE_STRAINER, from_encoding=html_encoding)
 
         # --- Primary Scraping Strategy ---
         # Look for divs likely containing individual mod details. Common class names observed.
         # Regex allows matching slight variations if Steam changes class names (e.g., workshopItemLarge).
-        mod_containers = soup.find_all('div', class_=re.compile(r'(workshopItem|collectionItem)\b'))
+        mod_containers = soup.find_all('div', class_=_RE_CONTAINER)
         if not mod_containers:
             # Fallback if primary classes are not found (less reliable)
             mod_containers = soup.find_all('div', class_='item')
         logging.info(f"Found {len(mod_containers)} potential mod containers using primary strategy.")
 
-        placeholder_prefix = "Name not found" # Constant for placeholder name start
-
         for container in mod_containers:
             # Find the workshop item link within this container
             # Regex looks for the standard filedetails URL pattern.
-            link_element = container.find('a', href=re.compile(r'/sharedfiles/filedetails/\?id='))
+            link_element = container.find('a', href=_RE_HREF)
             if not link_element: continue # Skip if no link found
 
             href = link_element.get('href')
-            match = re.search(r'id=(\d+)', href) # Extract the numeric mod ID
+            match = _RE_ID.search(href) # Extract the numeric mod ID
             if not match: continue # Skip if ID couldn't be parsed
 
             mod_id = match.group(1)
 
             # Find the mod title div within the container
             # Regex looks for common title class names, case-insensitive.
-            name_element = container.find('div', class_=re.compile(r'(workshopItemTitle|item_title|title)\b', re.IGNORECASE))
-            mod_name = ""
-            if name_element:
-                mod_name = name_element.get_text(strip=True) # Get text, remove surrounding whitespace
-            else:
-                # Fallback: If title div not found, try using the link's text content
-                mod_name_fallback = link_element.get_text(strip=True)
-                if mod_name_fallback: mod_name = mod_name_fallback
-
-            # Assign placeholder if no name was found by any method
-            if not mod_name: mod_name = f"{placeholder_prefix} ({mod_id})"
+            name_element = container.find('div', class_=_RE_TITLE)
+            # Get text, removing surrounding whitespace. Fallback: if the title div wasn't found, use
+            # the link's text content. Assign a placeholder if no name was found by either method.
+            mod_name = (name_element if name_element else link_element).get_text(strip=True) or f"{placeholder_prefix} ({mod_id})"
 
             # --- Store/Update Mod Details ---
-            existing_name = mod_details_dict.get(mod_id)
-            # Add if new, OR update if the existing entry was just a placeholder and the new one isn't.
-            # This prioritizes keeping a real name once found.
-            if not existing_name or (existing_name.startswith(placeholder_prefix) and not mod_name.startswith(placeholder_prefix)):
-                mod_details_dict[mod_id] = mod_name
+            add_mod(mod_id, mod_name)
 
         # --- Fallback Scraping Strategy ---
         # Use this only if the primary strategy yielded absolutely nothing.
         # This is less reliable as it finds *all* matching links on the page,
         # potentially including related items or duplicates.
-        if not mod_details_dict and not mod_containers:
+        if not mod_ids and not mod_containers:
              logging.warning("Primary scraping strategy failed. Trying broader link search fallback.")
-             # Find all links matching the filedetails pattern anywhere on the page
-             links = soup.find_all('a', href=re.compile(r'https://steamcommunity\.com/sharedfiles/filedetails/\?id='))
-             for link in links:
+             # Find all links matching the filedetails pattern anywhere on the page, each paired with
+             # the *next* title div after it (less reliable). Links and title divs are collected in a
+             # single document-order pass; walking it backwards, the most recent title div seen is the
+             # one link.find_next('div', class_='workshopItemTitle') would return, without a forward
+             # scan over the rest of the page for every link.
+             links = []
+             next_title = None
+             for element in reversed(soup.find_all(['a', 'div'])):
+                 if element.name == 'div':
+                     if 'workshopItemTitle' in element.get('class', ()): next_title = element
+                 elif _RE_FULLURL.search(element.get('href', '')):
+                     links.append((element, next_title))
+             links.reverse() # Back to document order
+             for link, name_element in links:
                  href = link.get('href')
-                 match = re.search(r'id=(\d+)', href)
+                 match = _RE_ID.search(href)
                  if match:
                      mod_id = match.group(1)
-                     # Attempt to find the *next* title div after the link (less reliable)
-                     name_element = link.find_next('div', class_='workshopItemTitle')
+                     # Already found with a real name (e.g., image + title links to the same item):
+                     # nothing left to update, so skip the remaining checks
+                     idx = id_index.get(mod_id)
+                     if idx is not None and not mod_names[idx].startswith(placeholder_prefix): continue
                      mod_name = name_element.text.strip() if name_element else f"{placeholder_prefix} ({mod_id})"
 
                      # Heuristic check to try and skip the collection's own link in the results
                      # Checks if the link is inside a div commonly used for the main collection info.
                      if source_type == 'url' and f"id={mod_id}" in source and link.find_parent('div', class_='collectioninfo'):
-                          logging.info(f"Skipping potential collection link in fallback: {mod_id}")
+                          logging.info("Skipping potential collection link in fallback: %s", mod_id)
                           continue # Skip this link
 
-                     # Apply same dictionary update logic as primary strategy
-                     existing_name = mod_details_dict.get(mod_id)
-                     if not existing_name or (existing_name.startswith(placeholder_prefix) and not mod_name.startswith(placeholder_prefix)):
-                         mod_details_dict[mod_id] = mod_name
+                     # Apply same update logic as primary strategy
+                     add_mod(mod_id, mod_name)
 
-        # Convert the final dictionary to a list of dicts, sorted numerically by ID
-        mod_details = [{'id': k, 'name': v} for k, v in sorted(mod_details_dict.items(), key=lambda item: int(item[0]))]
+        # Build the final list of dicts, sorted numerically by ID.
+        # Each ID is converted to int once, then the indices are sorted by those keys.
+        sort_keys = [int(mod_id) for mod_id in mod_ids]
+        order = sorted(range(len(mod_ids)), key=sort_keys.__getitem__)
+        mod_details = [{'id': mod_ids[i], 'name': mod_names[i]} for i in order]
         logging.info(f"Scraped {len(mod_details)} unique mods.")
+        if source_type == 'url' and mod_details:
+            _store_cached_scrape(source, mod_details) # Empty results aren't cached so a retry refetches
         return mod_details
 
     # --- Error Handling ---
+    # No dialogs are shown from here: this runs on a background thread, and Tk may only be
+    # used from the main thread. The caller displays the returned error instead.
     except requests.exceptions.RequestException as e:
         # Handle network-related errors (DNS, connection, timeout, etc.)
         logging.error(f"Network error fetching URL: {e}")
-        messagebox.showerror("Network Error", f"Error fetching URL:\n{e}")
-        return [] # Return empty list on network error
+        return {'error_title': "Network Error", 'error': f"Error fetching URL:\n{e}"}
     except ValueError as e:
          # Handle specific value errors (e.g., invalid source_type)
          logging.error(f"Value error during scraping setup: {e}")
-         messagebox.showerror("Error", f"Configuration error: {e}")
-         return []
+         return {'error_title': "Error", 'error': f"Configuration error: {e}"}
     except Exception as e:
         # Catch any other unexpected errors during scraping/parsing
         logging.exception("An unexpected error occurred during scraping.") # Log full traceback
-        messagebox.showerror("Scraping Error", f"An unexpected error occurred during scraping:\n{e}")
-        return [] # Return empty list for other errors
+        return {'error_title': "Scraping Error", 'error': f"An unexpected error occurred during scraping:\n{e}"}
+
+
+def _scrape_worker(source, source_type, result_queue):
+    """
+    Background thread target running scrape_mod_details.
+
+    Puts exactly one result on `result_queue`: the list of mods, or an
+    error dict ({'error_title': ..., 'error': ...}) for the main thread to show.
+    """
+    try:
+        result_queue.put(scrape_mod_details(source, source_type))
+    except Exception as e:
+        # scrape_mod_details handles its own errors; this is a last-resort guard
+        logging.exception("Unexpected error in scraping thread.")
+        result_queue.put({'error_title': "Error", 'error': f"Failed to load mods:\n{e}"})
+
+
+def _is_regular_file(path):
+    """Returns True if `path` is an existing regular file, using a single stat() call."""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except (OSError, ValueError): # Missing/inaccessible path, or invalid characters in it
+        return False
+
+def _run_steamcmd(steamcmd_command, progress_queue, completed_before=0):
+    """
+    Runs a single SteamCMD command and streams its output until it exits.
+
+    Stderr is merged into stdout, so one pipe carries SteamCMD's output in the
+    order it was written and is read line by line right here (this already
+    runs on the download thread). Lines are logged as they arrive and then
+    dropped, apart from a short tail kept for error messages, so memory use
+    doesn't grow with the length of the session. The most recent line is
+    forwarded to the GUI as 'current_mod', throttled to PROGRESS_UPDATE_INTERVAL
+    ("Downloading item" lines are always forwarded), and each
+    "Success. Downloaded item" line advances the overall progress bar.
+
+    Args:
+        steamcmd_command (list): The full argv to execute.
+        progress_queue (queue.SimpleQueue): Queue for sending progress/status dicts.
+        completed_before (int): Items already downloaded by earlier batches, added
+                                to this run's count for the overall progress value.
+
+    Returns:
+        tuple: (returncode, output_tail, success_count, platform_error) where
+               output_tail is the joined text of the last output lines, success_count
+               the number of "Success. Downloaded item" lines seen and platform_error
+               whether SteamCMD reported it couldn't find an available CPlatform instance.
+
+    Raises:
+        FileNotFoundError: If the SteamCMD executable doesn't exist.
+        OSError: If the process couldn't be started.
+    """
+    # Use Popen for non-blocking execution.
+    # On POSIX, SteamCMD gets its own session, so a Ctrl-C in the terminal running this app
+    # doesn't also SIGINT SteamCMD in the middle of a download.
+    process = subprocess.Popen(steamcmd_command,
+                               stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT, # Merged: one pipe, one reader, original ordering
+                               text=True, # Decode output as text
+                               encoding='utf-8', # Specify encoding
+                               errors='replace', # Handle potential decoding errors
+                               bufsize=1, # Line-buffered, so each line is available promptly
+                               start_new_session=(os.name == 'posix'))
+
+    output_tail = deque(maxlen=20) # Last non-empty lines, quoted in the error message if SteamCMD fails
+    success_count = 0 # Number of "Success. Downloaded item" lines seen so far
+    platform_error = False # Whether the "no available CPlatform instance" error was printed
+    last_gui_update = 0.0 # monotonic timestamp of the last line forwarded to the GUI
+    # Checked once per run: when INFO is filtered out, the per-line logging call is skipped entirely
+    # (lazy %-style args are used either way, so nothing is formatted unless it's emitted).
+    log_output = steamcmd_logger.isEnabledFor(logging.INFO)
+    logging.info("--- SteamCMD Output Start ---")
+    with process.stdout:
+        for line in iter(process.stdout.readline, ''):
+            line = line.strip()
+            if not line: continue
+            if log_output: steamcmd_logger.info("%s", line)
+            output_tail.append(line)
+            now = time.monotonic()
+            if "Success. Downloaded item" in line:
+                success_count += 1
+                # Once per item, so not throttled: lets the overall bar move during the download itself
+                progress_queue.put({'overall_value': completed_before + success_count})
+            elif line.startswith("Downloading item"):
+                # Always show which item SteamCMD has moved on to, even inside the throttle window
+                last_gui_update = 0.0
+            elif "available CPlatform instance" in line:
+                platform_error = True
+            # Forward at most ~30 lines/second; SteamCMD can emit thousands of lines and the
+            # GUI only needs to show the most recent one.
+            if now - last_gui_update >= PROGRESS_UPDATE_INTERVAL:
+                progress_queue.put({'current_mod': line})
+                last_gui_update = now
+    process.wait() # The pipe is closed; reap the process to get its return code
+    logging.info("--- SteamCMD Output End ---")
+
+    return process.returncode, "\n".join(output_tail), success_count, platform_error
+
+
+def _resolve_steamcmd_executable(steamcmd_path_setting):
+    """
+    Determines which SteamCMD executable to run.
+
+    Checks the path from settings first, then auto-detects common install
+    locations for the current OS, then searches PATH, and finally falls back
+    to the bare 'steamcmd' command name.
+    Successful lookups are cached (keyed on the settings value and platform),
+    so repeated downloads don't re-probe the filesystem.
+
+    Args:
+        steamcmd_path_setting (str): The 'steamcmd_path' value from settings (may be empty).
+
+    Returns:
+        str: Path (or bare command name) of the SteamCMD executable.
+    """
+    global _steamcmd_exe_cache
+    cache_key = (steamcmd_path_setting, sys.platform)
+    if _steamcmd_exe_cache and _steamcmd_exe_cache[0] == cache_key:
+        logging.info(f"Using previously resolved SteamCMD path: {_steamcmd_exe_cache[1]}")
+        return _steamcmd_exe_cache[1]
+
+    if steamcmd_path_setting and _is_regular_file(steamcmd_path_setting):
+        logging.info(f"Using SteamCMD path from settings: {steamcmd_path_setting}")
+        _steamcmd_exe_cache = (cache_key, steamcmd_path_setting)
+        return steamcmd_path_setting
+
+    if steamcmd_path_setting: logging.warning(f"SteamCMD path invalid: '{steamcmd_path_setting}'. Auto-detecting.")
+    logging.info("Attempting to auto-detect SteamCMD path...")
+    base_cmd = "steamcmd"; exe_suffix = ".exe" if sys.platform == "win32" else ".sh" if sys.platform == "darwin" else ""
+    script_name = base_cmd + exe_suffix; possible_paths = []
+    # Define common installation paths based on OS
+    if sys.platform == "win32": possible_paths = [ os.path.join(os.environ.get("ProgramFiles(x86)", ""), "Steam", script_name), os.path.join(os.environ.get("ProgramFiles", ""), "Steam", script_name) ]
+    elif sys.platform == "darwin": possible_paths = ["~/steamcmd/steamcmd.sh", "/usr/local/bin/steamcmd", "/Applications/SteamCMD/steamcmd.sh"]
+    elif sys.platform.startswith("linux"): possible_paths = ["~/.steam/steamcmd/steamcmd.sh", "~/steamcmd/steamcmd.sh", "/usr/games/steamcmd", "/usr/bin/steamcmd"]
+    # Find first existing path from the list (expanding each candidate only once)
+    for candidate in possible_paths:
+        candidate = os.path.expanduser(candidate)
+        if _is_regular_file(candidate):
+            logging.info(f"Auto-detected SteamCMD at: {candidate}")
+            _steamcmd_exe_cache = (cache_key, candidate)
+            return candidate
+
+    # Next, search the system's PATH (shutil.which also applies PATHEXT, e.g. '.exe', on Windows)
+    path_executable = shutil.which(base_cmd)
+    if path_executable:
+        logging.info(f"Found SteamCMD in system PATH: {path_executable}")
+        _steamcmd_exe_cache = (cache_key, path_executable)
+        return path_executable
+
+    # Fallback: Let the OS resolve the bare command name; starting it will fail with
+    # FileNotFoundError (reported to the user) if it really isn't installed.
+    # Not cached, so a SteamCMD installed later in a common location is still picked up.
+    logging.info(f"SteamCMD not found in common locations or PATH, trying '{base_cmd}' anyway.")
+    return base_cmd
+
+
+def _target_name_candidates(base_name, mod_id, max_counter=10):
+    """
+    Yields the folder names to try, in order, for a mod being moved into the install dir.
+
+    Args:
+        base_name (str): The sanitized mod name.
+        mod_id (str): The mod's workshop ID, used to disambiguate collisions.
+        max_counter (int): Highest numeric suffix to try before giving up.
+
+    Yields:
+        str: base_name, then base_name_<mod_id>, then base_name_<mod_id>_1 ... _<max_counter>.
+    """
+    yield base_name
+    yield f"{base_name}_{mod_id}"
+    for counter in range(1, max_counter + 1):
+        yield f"{base_name}_{mod_id}_{counter}"
 
 
 def download_mods_with_steamcmd(selected_mods, install_path, progress_queue):
@@ -404,8 +758,9 @@ def download_mods_with_steamcmd(selected_mods, install_path, progress_queue):
 
     1. Determines the SteamCMD executable path (from settings or auto-detect).
     2. Creates a temporary download directory inside the user's chosen install path.
-    3. Runs SteamCMD using subprocess.Popen to download all selected mods into the temp dir.
-    4. Waits for SteamCMD to complete.
+    3. Runs SteamCMD using subprocess.Popen to download all selected mods into the temp dir,
+       in batches of STEAMCMD_BATCH_SIZE mods per run.
+    4. Waits for each SteamCMD run to complete.
     5. If SteamCMD was successful, iterates through downloaded mods:
         - Sanitizes the mod name.
         - Moves the mod folder from the temp structure to the final install path,
@@ -417,7 +772,7 @@ def download_mods_with_steamcmd(selected_mods, install_path, progress_queue):
     Args:
         selected_mods (list): List of tuples [(mod_id, mod_name), ...].
         install_path (str): The target base directory chosen by the user.
-        progress_queue (queue.Queue): Queue for sending progress/status dicts.
+        progress_queue (queue.SimpleQueue): Queue for sending progress/status dicts.
     """
     # Send initial status update to the progress window
     progress_queue.put({'status': 'Initializing download...', 'overall_value': 0})
@@ -432,38 +787,15 @@ def download_mods_with_steamcmd(selected_mods, install_path, progress_queue):
 
     # --- Get Settings and Validate ---
     steamcmd_path_setting = app_settings.get("steamcmd_path", "")
-    app_id = app_settings.get("app_id", get_default_settings()["app_id"])
-    if not app_id or not app_id.isdigit():
+    app_id = app_settings.get("app_id") or _DEFAULT_SETTINGS["app_id"]
+    if not is_ascii_number(app_id):
         errmsg = f"Invalid or missing App ID in settings: '{app_id}'. Cannot download."
         logging.error(errmsg)
         progress_queue.put({'error': errmsg, 'finished': True}) # Send error via queue
         return
 
     # --- Determine SteamCMD Executable ---
-    # (Logic remains the same: check settings, then auto-detect based on OS, finally assume in PATH)
-    steamcmd_executable = ""
-    if steamcmd_path_setting and os.path.exists(steamcmd_path_setting) and os.path.isfile(steamcmd_path_setting):
-        steamcmd_executable = steamcmd_path_setting
-        logging.info(f"Using SteamCMD path from settings: {steamcmd_executable}")
-    else:
-        if steamcmd_path_setting: logging.warning(f"SteamCMD path invalid: '{steamcmd_path_setting}'. Auto-detecting.")
-        logging.info("Attempting to auto-detect SteamCMD path...")
-        base_cmd = "steamcmd"; exe_suffix = ".exe" if sys.platform == "win32" else ".sh" if sys.platform == "darwin" else ""
-        script_name = base_cmd + exe_suffix; possible_paths = []
-        # Define common installation paths based on OS
-        if sys.platform == "win32": possible_paths = [ os.path.join(os.environ.get("ProgramFiles(x86)", ""), "Steam", script_name), os.path.join(os.environ.get("ProgramFiles", ""), "Steam", script_name) ]
-        elif sys.platform == "darwin": possible_paths = ["~/steamcmd/steamcmd.sh", "/usr/local/bin/steamcmd", "/Applications/SteamCMD/steamcmd.sh"]
-        elif sys.platform.startswith("linux"): possible_paths = ["~/.steam/steamcmd/steamcmd.sh", "~/steamcmd/steamcmd.sh", "/usr/games/steamcmd", "/usr/bin/steamcmd"]
-        # Find first existing path from the list
-        found_path = next((os.path.expanduser(p) for p in possible_paths if os.path.exists(os.path.expanduser(p))), None)
-        if found_path:
-            steamcmd_executable = found_path
-            logging.info(f"Auto-detected SteamCMD at: {steamcmd_executable}")
-        else:
-            # Fallback: Assume the command name is in the system's PATH environment variable
-            steamcmd_executable = base_cmd
-            logging.info(f"SteamCMD not found in common locations, assuming '{steamcmd_executable}' is in system PATH.")
-
+    steamcmd_executable = _resolve_steamcmd_executable(steamcmd_path_setting)
 
     # --- Prepare Temporary Download Path ---
     # We create a temporary subdir to contain the 'steamapps' structure SteamCMD creates.
@@ -483,64 +815,55 @@ def download_mods_with_steamcmd(selected_mods, install_path, progress_queue):
         progress_queue.put({'error': error_message, 'finished': True})
         return
 
-    # --- Build and Execute SteamCMD Command ---
-    steamcmd_command = [
+    # --- Build and Execute SteamCMD Commands ---
+    # Mods are downloaded in batches of STEAMCMD_BATCH_SIZE per SteamCMD run, so a huge selection
+    # can't exceed the OS command-line length limit (~32 KiB on Windows). Each run logs in once for
+    # its whole batch, and all runs share the same install dir.
+    base_command = [
         steamcmd_executable,
-        "+login", "anonymous", # Use anonymous login for workshop downloads
+        # SteamCMD expects the install dir to be set before logging in
         "+force_install_dir", steamcmd_install_dir, # Tell SteamCMD where to put 'steamapps'
+        "+login", "anonymous", # Use anonymous login for workshop downloads
     ]
-    # Add download command for each selected mod ID
-    for mod_id in mod_ids:
-        steamcmd_command.extend(["+workshop_download_item", app_id, str(mod_id)])
-    steamcmd_command.extend(["+quit"]) # Ensure SteamCMD exits after commands
-
-    logging.info(f"Executing SteamCMD: {' '.join(steamcmd_command)}")
-    progress_queue.put({'status': 'Running SteamCMD (this may take a while)...'}) # Update status
+    batches = [mod_ids[i:i + STEAMCMD_BATCH_SIZE] for i in range(0, len(mod_ids), STEAMCMD_BATCH_SIZE)]
 
     process_success = False # Flag to track if SteamCMD ran without critical errors
-    full_stdout = ""
-    stderr_output = ""
+    downloaded_count = 0 # Items SteamCMD reported as downloaded, across all batches so far
     try:
-        # Use Popen for non-blocking execution (though we wait with communicate).
-        # Capture stdout/stderr for logging and basic result checking.
-        process = subprocess.Popen(steamcmd_command,
-                                   stdout=subprocess.PIPE,
-                                   stderr=subprocess.PIPE,
-                                   text=True, # Decode output as text
-                                   encoding='utf-8', # Specify encoding
-                                   errors='replace') # Handle potential decoding errors
-
-        # communicate() waits for process termination and reads all output.
-        # Good for processes that finish relatively quickly and don't produce massive output.
-        # For extremely long downloads or huge output, line-by-line reading (as in previous version)
-        # might be better, but requires more complex handling of process state.
-        full_stdout, stderr_output = process.communicate()
-
-        logging.info("--- SteamCMD Output Start ---")
-        logging.info(full_stdout.strip()) # Log captured stdout
-        logging.info("--- SteamCMD Output End ---")
-        if stderr_output:
-            logging.warning(f"SteamCMD stderr output:\n{stderr_output.strip()}") # Log stderr if any
-
-        # --- Check SteamCMD Result ---
-        if process.returncode != 0:
-            # SteamCMD exited with an error code
-            error_message = f"SteamCMD process failed (Code: {process.returncode})."
-            # Provide more specific feedback based on common error messages/codes
-            if "No such file or directory" in stderr_output or "command not found" in stderr_output or process.returncode == 127:
-                 error_message += f"\n\n'{steamcmd_executable}' was not found or is not executable. Check Settings or PATH."
-            elif "available CPlatform instance" in full_stdout or "connect to Steam" in stderr_output:
-                 error_message += f"\n\nSteamCMD failed to connect or initialize. Check network or SteamCMD install."
-            else:
-                 # Generic error message
-                 error_message += f"\n\nCheck console logs for details.\nStderr: {stderr_output.strip()}"
-            logging.error(f"SteamCMD execution failed. {error_message}")
-            progress_queue.put({'error': error_message, 'finished': True})
-            # Do not proceed to post-processing if SteamCMD failed
-            return
-        else:
-             # SteamCMD exited with code 0, assume success for now
-             process_success = True
+        for batch_num, batch_ids in enumerate(batches, start=1):
+            # Add download command for each mod ID in this batch, built in a single pass
+            steamcmd_command = base_command + [arg for mod_id in batch_ids for arg in ("+workshop_download_item", app_id, str(mod_id))]
+            steamcmd_command.append("+quit") # Ensure SteamCMD exits after commands
+
+            # shlex.join quotes arguments with spaces, so the logged command can be copy-pasted
+            logging.info(f"Executing SteamCMD (batch {batch_num}/{len(batches)}): {shlex.join(steamcmd_command)}")
+            status = 'Running SteamCMD (this may take a while)...'
+            if len(batches) > 1: status = f'Running SteamCMD, batch {batch_num}/{len(batches)} (this may take a while)...'
+            progress_queue.put({'status': status}) # Update status
+
+            returncode, output_tail, success_count, platform_error = _run_steamcmd(steamcmd_command, progress_queue, downloaded_count)
+            downloaded_count += success_count
+            logging.info(f"SteamCMD reported {success_count}/{len(batch_ids)} items downloaded successfully.")
+
+            # --- Check SteamCMD Result ---
+            if returncode != 0:
+                # SteamCMD exited with an error code
+                error_message = f"SteamCMD process failed (Code: {returncode})."
+                # Provide more specific feedback based on common error messages/codes
+                if "No such file or directory" in output_tail or "command not found" in output_tail or returncode == 127:
+                     error_message += f"\n\n'{steamcmd_executable}' was not found or is not executable. Check Settings or PATH."
+                elif platform_error or "connect to Steam" in output_tail:
+                     error_message += f"\n\nSteamCMD failed to connect or initialize. Check network or SteamCMD install."
+                else:
+                     # Generic error message
+                     error_message += f"\n\nCheck console logs for details.\nLast output:\n{output_tail}"
+                logging.error(f"SteamCMD execution failed (batch {batch_num}/{len(batches)}). {error_message}")
+                progress_queue.put({'error': error_message, 'finished': True})
+                # Do not run further batches or proceed to post-processing if SteamCMD failed
+                return
+
+        # Every batch exited with code 0, assume success for now
+        process_success = True
 
     except FileNotFoundError:
         # This specifically catches if the steamcmd_executable itself couldn't be found by Popen
@@ -549,7 +872,7 @@ def download_mods_with_steamcmd(selected_mods, install_path, progress_queue):
         progress_queue.put({'error': error_message, 'finished': True})
         return
     except Exception as e:
-        # Catch other potential errors during Popen or communicate
+        # Catch other potential errors while starting or reading from SteamCMD
         logging.exception("Unexpected error during SteamCMD execution.")
         progress_queue.put({'error': f"Unexpected error running SteamCMD:\n{e}", 'finished': True})
         return
@@ -568,61 +891,148 @@ def download_mods_with_steamcmd(selected_mods, install_path, progress_queue):
     mods_failed_count = 0
     total_mods_to_process = len(selected_mods)
 
-    for i, (mod_id, mod_name) in enumerate(selected_mods):
-        # Update progress display before processing each mod
-        progress_queue.put({
-            'status': f'Processing {i+1}/{total_mods_to_process}', # e.g., "Processing 5/10"
-            'current_mod': f'{mod_name} ({mod_id})', # Show which mod is being handled
-            'overall_value': i # Update overall bar (0 to total_mods-1)
-        })
+    # SteamCMD puts each item in <temp>/steamapps/workshop/content/<app_id>/<mod_id>. Read that
+    # directory once: scandir entries already know whether they're directories (from the directory
+    # read itself on most platforms), so the loop below doesn't need an isdir() stat per mod.
+    content_dir = os.path.join(steamcmd_install_dir, 'steamapps', 'workshop', 'content', app_id)
+    try:
+        with os.scandir(content_dir) as entries:
+            downloaded_ids = {entry.name for entry in entries if entry.is_dir()}
+    except OSError as e:
+        logging.warning(f"Could not read download directory '{content_dir}': {e}")
+        downloaded_ids = set() # Nothing was downloaded (or it's unreadable); every mod is reported below
+
+    # Likewise, snapshot the names already in the install directory once; collision checks then
+    # become set lookups, and each mod moved in is added. Names are casefolded because Windows
+    # and macOS filesystems are usually case-insensitive ("alpha" collides with "Alpha"); on a
+    # case-sensitive filesystem that just means an occasional unneeded "_<mod_id>" suffix.
+    try:
+        with os.scandir(install_path_abs) as entries:
+            existing_names = {entry.name.casefold() for entry in entries}
+    except OSError as e:
+        logging.warning(f"Could not list install directory '{install_path_abs}': {e}")
+        existing_names = set()
 
+    # The temp dir normally shares the install dir's filesystem, making every move a cheap rename.
+    # If something like a mount point puts it on another device, each move is a full copy + delete,
+    # bound by disk throughput; those are then handed to a thread pool to overlap (see below).
+    try:
+        cross_device = os.stat(content_dir).st_dev != os.stat(install_path_abs).st_dev
+    except OSError:
+        cross_device = False # Nothing was downloaded; every mod is reported as missing anyway
+    copy_executor = ThreadPoolExecutor(max_workers=COPY_WORKERS) if cross_device else None
+    copy_jobs = {} # Future -> (mod_id, source path, target path) for the copies in flight
+    if cross_device: logging.info("Temporary and install directories are on different devices; copying mods in parallel.")
+
+    # Per-mod paths are built by appending to these (joining with "" ends each in exactly one
+    # separator) instead of an os.path.join call for every path in every iteration
+    content_prefix = os.path.join(content_dir, "")
+    install_prefix = os.path.join(install_path_abs, "")
+
+    # --- Plan Target Names ---
+    # Every mod's target is worked out before anything is moved: sanitizing and collision checks
+    # are pure in-memory work, and each chosen name is reserved in `existing_names` straight away,
+    # so later mods (including two whose names sanitize to the same folder) see it. The move loop
+    # below is then just filesystem operations.
+    move_plan = [] # (mod_id, mod_name, source path, target path) for each mod to move
+    for mod_id, mod_name in selected_mods:
         # Construct the expected path where SteamCMD placed the mod content
-        source_mod_path = os.path.join(steamcmd_install_dir, 'steamapps', 'workshop', 'content', app_id, mod_id)
+        source_mod_path = content_prefix + mod_id
+        if mod_id not in downloaded_ids:
+            # This case occurs if SteamCMD exited successfully but failed to download this specific item.
+            logging.warning("Source directory for mod ID %s not found at '%s'. Download might have failed silently. Skipping move.", mod_id, source_mod_path)
+            mods_failed_count += 1 # Count as failed if source doesn't exist
+            continue
 
         # Sanitize the mod name to create a valid target folder name
         target_folder_name_base = sanitize_filename(mod_name)
-        # Construct the initial target path directly under the user's chosen install directory
-        target_mod_path = os.path.join(install_path_abs, target_folder_name_base)
 
         # --- Handle Potential Name Collisions ---
         # If a directory with the sanitized name already exists, append the mod ID
-        # to ensure uniqueness. Check again in case even that exists (highly unlikely).
-        collision_counter = 1
-        target_folder_name = target_folder_name_base
-        while os.path.exists(target_mod_path):
-            logging.warning(f"Target path '{target_mod_path}' already exists. Handling collision.")
-            # First attempt: append mod ID
-            target_folder_name = f"{target_folder_name_base}_{mod_id}"
-            target_mod_path = os.path.join(install_path_abs, target_folder_name)
-            # If ID-appended name also exists, append a counter
-            if os.path.exists(target_mod_path):
-                 target_folder_name = f"{target_folder_name_base}_{mod_id}_{collision_counter}"
-                 target_mod_path = os.path.join(install_path_abs, target_folder_name)
-                 collision_counter += 1
-
-            # Safety break to prevent infinite loop in extremely unlikely scenarios
-            if collision_counter > 10:
-                 logging.error(f"Could not find unique target name for mod ID {mod_id} near '{target_folder_name_base}'. Skipping move.")
-                 mods_failed_count += 1
-                 break # Break collision handling loop for this mod
-
-        if os.path.exists(target_mod_path): continue # Skip this mod if collision handling failed
-
-        # --- Move the Mod Directory ---
-        if os.path.isdir(source_mod_path):
+        # to ensure uniqueness, then a counter in case even that exists (highly unlikely).
+        # Checked against the snapshot of existing names, not with a stat per candidate.
+        target_folder_name = next((name for name in _target_name_candidates(target_folder_name_base, mod_id)
+                                   if name.casefold() not in existing_names), None)
+        if target_folder_name is None:
+            logging.error("Could not find unique target name for mod ID %s near '%s'. Skipping move.", mod_id, target_folder_name_base)
+            mods_failed_count += 1
+            continue
+        if target_folder_name != target_folder_name_base:
+            logging.warning("Target path '%s' already exists. Handling collision.", install_prefix + target_folder_name_base)
+        existing_names.add(target_folder_name.casefold()) # Reserve the name for this mod
+        # Target path directly under the user's chosen install directory
+        move_plan.append((mod_id, mod_name, source_mod_path, install_prefix + target_folder_name))
+
+    # --- Move the Mod Directories ---
+    mods_skipped_count = mods_failed_count # Already settled during planning
+    last_gui_update = 0.0 # monotonic timestamp of the last progress update sent
+    try:
+        for i, (mod_id, mod_name, source_mod_path, target_mod_path) in enumerate(move_plan):
+            if copy_executor is not None:
+                # Submitting takes microseconds; progress is reported as the copies finish (below),
+                # since counting submissions here would fill the bar before anything was copied
+                logging.info("Copying '%s' to '%s'", source_mod_path, target_mod_path)
+                copy_jobs[copy_executor.submit(shutil.move, source_mod_path, target_mod_path)] = (mod_id, source_mod_path, target_mod_path)
+                continue
+
+            # Update progress display before processing a mod, at most every PROGRESS_UPDATE_INTERVAL:
+            # same-filesystem renames take microseconds, so per-mod updates would just flood the queue
+            # (and the GUI) with states nobody gets to see. The final update below reports the totals.
+            now = time.monotonic()
+            if now - last_gui_update >= PROGRESS_UPDATE_INTERVAL:
+                progress_queue.put({
+                    'status': f'Processing {i+1}/{len(move_plan)}', # e.g., "Processing 5/10"
+                    'current_mod': f'{mod_name} ({mod_id})', # Show which mod is being handled
+                    'overall_value': mods_skipped_count + i # Update overall bar (0 to total_mods-1)
+                })
+                last_gui_update = now
+
             try:
-                logging.info(f"Moving '{source_mod_path}' to '{target_mod_path}'")
-                # shutil.move works for renaming/moving directories
-                shutil.move(source_mod_path, target_mod_path)
+                logging.info("Moving '%s' to '%s'", source_mod_path, target_mod_path)
+                # The temp dir lives inside the install dir, so this is a same-filesystem rename: a
+                # single metadata operation, however large the mod. shutil.move (copy + delete) is
+                # only needed if something like a mount point puts them on different devices.
+                try:
+                    os.rename(source_mod_path, target_mod_path)
+                except OSError as e:
+                    if e.errno != errno.EXDEV: raise
+                    shutil.move(source_mod_path, target_mod_path)
                 mods_moved_count += 1
+            except FileNotFoundError:
+                # The rename reports a missing source itself; this only happens if the folder vanished
+                # after the directory listing above, so no separate exists() check is made per mod
+                logging.warning("Source directory for mod ID %s not found at '%s'. Download might have failed silently. Skipping move.", mod_id, source_mod_path)
+                mods_failed_count += 1
             except (shutil.Error, OSError, IOError) as e:
                 # Catch errors during the move operation (permissions, disk full, etc.)
-                logging.error(f"Error moving mod ID {mod_id} from '{source_mod_path}' to '{target_mod_path}': {e}")
+                logging.error("Error moving mod ID %s from '%s' to '%s': %s", mod_id, source_mod_path, target_mod_path, e)
                 mods_failed_count += 1
-        else:
-            # This case occurs if SteamCMD exited successfully but failed to download this specific item.
-            logging.warning(f"Source directory for mod ID {mod_id} not found at '{source_mod_path}'. Download might have failed silently. Skipping move.")
-            mods_failed_count += 1 # Count as failed if source doesn't exist
+
+        # --- Wait for Cross-Device Copies ---
+        # Results are collected here, on this thread only, so the counters need no locking.
+        for copies_done, future in enumerate(as_completed(copy_jobs), start=1):
+            mod_id, source_mod_path, target_mod_path = copy_jobs[future]
+            try:
+                future.result()
+                mods_moved_count += 1
+            except FileNotFoundError: # Same as the rename path above: the source vanished after listing
+                logging.warning("Source directory for mod ID %s not found at '%s'. Download might have failed silently. Skipping move.", mod_id, source_mod_path)
+                mods_failed_count += 1
+            except (shutil.Error, OSError, IOError) as e:
+                logging.error("Error moving mod ID %s from '%s' to '%s': %s", mod_id, source_mod_path, target_mod_path, e)
+                mods_failed_count += 1
+            # One update per finished copy: each takes a while, so these can't flood the queue
+            progress_queue.put({
+                'status': f'Copied {copies_done}/{len(copy_jobs)} mods',
+                'current_mod': os.path.basename(target_mod_path),
+                'overall_value': total_mods_to_process - len(copy_jobs) + copies_done
+            })
+    finally:
+        if copy_executor is not None:
+            # If anything above raised, don't start the copies still queued, and wait for the
+            # running ones, so no copy is still going once the download is reported as failed
+            for future in copy_jobs: future.cancel()
+            copy_executor.shutdown()
 
     logging.info(f"Finished moving mods. Moved: {mods_moved_count}, Failed/Skipped: {mods_failed_count}")
 
@@ -648,6 +1058,22 @@ def download_mods_with_steamcmd(selected_mods, install_path, progress_queue):
     })
 
 
+def _download_worker(selected_mods, install_path, progress_queue):
+    """
+    Background thread target wrapping download_mods_with_steamcmd.
+
+    Guarantees the GUI receives a final 'finished' message even if the
+    download raises unexpectedly; otherwise the progress window could never
+    be closed and the main window would stay disabled. Errors are reported
+    through the queue, never by calling Tk from this thread.
+    """
+    try:
+        download_mods_with_steamcmd(selected_mods, install_path, progress_queue)
+    except Exception as e:
+        logging.exception("Unexpected error in download thread.")
+        progress_queue.put({'error': f"Unexpected error during download:\n{e}", 'finished': True})
+
+
 # --- Progress Window ---
 
 # Global references to the progress window and its components
@@ -702,7 +1128,7 @@ def create_progress_window(parent, total_mods):
     # Used because we can't get granular % progress from SteamCMD easily.
     progress_bar_current = ttk.Progressbar(frame, mode='indeterminate', length=400)
     progress_bar_current.pack(fill="x", pady=(0, 15))
-    progress_bar_current.start(10) # Start pulsing animation (interval in ms)
+    progress_bar_current.start(50) # Start pulsing animation (step every 50ms: smooth enough, 5x fewer redraws than 10ms)
 
     # Overall Progress Bar (Determinate - fills up)
     progress_overall_var = tk.DoubleVar() # Use DoubleVar for smoother updates if needed
@@ -761,28 +1187,39 @@ def update_progress_display(update_data):
         # progress_window.after(2000, progress_window.destroy)
 
 
-def check_download_progress(progress_queue):
+def check_download_progress(progress_queue, idle_polls=0):
     """
     Periodically checks the progress queue for updates from the download thread.
     Schedules itself to run again using `root.after` until a 'finished' signal is received.
+    The interval adapts: 50ms while updates are arriving, backing off to 500ms while
+    the queue stays empty (e.g., a long SteamCMD download with no new output).
     This function runs in the main GUI thread.
+
+    Args:
+        progress_queue (queue.SimpleQueue): Queue the download thread sends updates on.
+        idle_polls (int): Number of consecutive previous checks that found the queue empty.
     """
     global progress_window, root # Need root to schedule next check
 
+    # Process all messages currently in the queue to avoid lag. They're merged into one update
+    # (later values win), so each widget is set once per check however many messages arrived.
+    pending = {}
+    try:
+        while not pending.get('finished', False):
+            pending.update(progress_queue.get_nowait()) # Non-blocking get
+    except queue.Empty:
+        # Queue is empty, no (more) updates right now. This is normal.
+        pass
+
     try:
-        # Process all messages currently in the queue to avoid lag
-        while True:
-            update_data = progress_queue.get_nowait() # Non-blocking get
-            update_progress_display(update_data) # Update GUI elements
+        if pending:
+            update_progress_display(pending) # Update GUI elements
 
             # If the 'finished' flag is set in the update, stop the check loop
-            if update_data.get('finished', False):
+            if pending.get('finished', False):
                 set_ui_state(tk.NORMAL) # Re-enable the main UI
                 logging.info("Download thread finished. Stopping progress check.")
                 return # Exit the function, stopping the loop
-    except queue.Empty:
-        # Queue is empty, no updates right now. This is normal.
-        pass
     except Exception as e:
         # Catch errors during the update process itself
         logging.exception("Error processing progress queue update.")
@@ -791,8 +1228,11 @@ def check_download_progress(progress_queue):
     # Reschedule the check if the progress window is still open
     # This creates the loop that periodically checks the queue.
     if progress_window and progress_window.winfo_exists():
-        # Schedule this function to run again after 100ms
-        root.after(100, lambda: check_download_progress(progress_queue))
+        # Schedule this function to run again: soon if updates are flowing, otherwise
+        # 100ms, 200ms, 400ms, then every 500ms, so an idle wait costs few wakeups
+        idle_polls = 0 if pending else idle_polls + 1
+        interval = 50 if not idle_polls else min(500, 50 << min(idle_polls, 4))
+        root.after(interval, lambda: check_download_progress(progress_queue, idle_polls))
     else:
         # Window was closed manually (though we try to prevent this) or unexpectedly
         logging.warning("Progress window closed unexpectedly. Stopping progress check.")
@@ -805,13 +1245,18 @@ def check_download_progress(progress_queue):
 def create_mod_selection_gui():
     """Creates and runs the main application window and its components."""
     global root # Make main window accessible globally for scheduling checks
+    # set_ui_state is defined below but also called by check_download_progress (module level),
+    # which re-enables the UI on the main thread once the download thread reports it's finished
+    global set_ui_state
     root = tk.Tk()
     root.title("Steam Mod Downloader")
     root.geometry("750x600") # Initial size
     root.minsize(650, 450) # Minimum allowed size
 
     # --- Style Configuration ---
-    style = ttk.Style()
+    # One Style instance configures every custom style up front (including those used by the
+    # settings window), instead of re-creating and re-configuring it each time a window opens.
+    style = ttk.Style(root)
     try:
         # 'clam' is a good cross-platform theme available in ttk
         style.theme_use('clam')
@@ -822,6 +1267,11 @@ def create_mod_selection_gui():
         style.configure("Accent.TButton", font=('Segoe UI', 9, 'bold')) # Example: bold font
     except tk.TclError:
         logging.warning("Could not configure Accent.TButton style.")
+    # Secondary style for hint labels in the settings window (might fail depending on theme)
+    try:
+        style.configure("secondary.TLabel", foreground="grey") # Use grey for less emphasis
+    except tk.TclError:
+        logging.warning("Could not configure secondary label style (theme might not support it).")
 
     # --- Top Bar Frame ---
     # Holds input selection, input fields, load button, settings button
@@ -895,9 +1345,11 @@ def create_mod_selection_gui():
     select_buttons_frame.pack(fill="x", pady=(0, 10)) # Space below this frame
 
     def select_all_mods(select_state):
-        """Sets the state of all mod checkboxes."""
-        if not mod_vars: return # Do nothing if list is empty
-        for var, _, _ in mod_vars: var.set(select_state)
+        """Selects or deselects every mod in the list (a single Treeview call either way)."""
+        nonlocal default_selected
+        if not mod_entries: return # Do nothing if list is empty
+        default_selected = select_state # Rows still to be inserted (see populate_mod_chunk) follow suit
+        mod_tree.selection_set(mod_tree.get_children() if select_state else ())
         update_mod_info() # Update count display
 
     ttk.Button(select_buttons_frame, text="Select All", command=lambda: select_all_mods(True)).pack(side="left", padx=(0, 5))
@@ -907,98 +1359,173 @@ def create_mod_selection_gui():
     info_label = ttk.Label(select_buttons_frame, text="Load mods to see details.", anchor="w")
     info_label.pack(side="left", padx=20, fill="x", expand=True)
 
-    # Frame containing the scrollable Canvas for the checkbutton list
+    # Frame containing the mod list Treeview and its scrollbar
     mod_list_frame = ttk.Frame(mod_outer_frame)
     mod_list_frame.pack(fill="both", expand=True)
 
-    global canvas, container, scrollbar # References needed for updates
-    # Use style lookup for background consistency
-    canvas_bg = style.lookup('TFrame', 'background')
-    canvas = tk.Canvas(mod_list_frame, borderwidth=0, background=canvas_bg, highlightthickness=0)
-    scrollbar = ttk.Scrollbar(mod_list_frame, orient="vertical", command=canvas.yview)
-    # This inner 'container' frame actually holds the checkbuttons
-    container = ttk.Frame(canvas)
+    global mod_tree, scrollbar # References needed for updates
+    # One Treeview row per mod, instead of one Checkbutton widget (+ BooleanVar) per mod.
+    # The Treeview's own selection *is* the set of mods to download, so (de)selecting
+    # everything is a single Tk call rather than one per mod. It also handles its own
+    # scrolling (including the mouse wheel) and only draws the rows currently visible.
+    mod_tree = ttk.Treeview(mod_list_frame, columns=("name", "id"), show="headings", selectmode="extended")
+    mod_tree.heading("name", text="Mod Name", anchor="w")
+    mod_tree.heading("id", text="Mod ID", anchor="w")
+    mod_tree.column("name", anchor="w", width=450, stretch=True) # Name column takes up extra width
+    mod_tree.column("id", anchor="w", width=120, stretch=False)
+    scrollbar = ttk.Scrollbar(mod_list_frame, orient="vertical", command=mod_tree.yview)
+    mod_tree.configure(yscrollcommand=scrollbar.set)
 
     scrollbar.pack(side="right", fill="y")
-    canvas.pack(side="left", fill="both", expand=True)
-    canvas.configure(yscrollcommand=scrollbar.set)
-    # Place the container frame onto the canvas
-    canvas_window = canvas.create_window((0, 0), window=container, anchor="nw", tags="container")
-
-    # --- Scrolling Configuration ---
-    # Update the canvas scrollregion when the container frame's size changes
-    def on_frame_configure(event): canvas.configure(scrollregion=canvas.bbox("all"))
-    # Update the container frame's width to match the canvas width when canvas resizes
-    def on_canvas_configure(event): canvas.itemconfig(canvas_window, width=event.width)
-    container.bind("<Configure>", on_frame_configure) # Bind to container size changes
-    canvas.bind("<Configure>", on_canvas_configure) # Bind to canvas size changes
-
-    # Mouse wheel scrolling logic (platform-specific delta calculation)
-    def on_mouse_wheel(event):
-        if sys.platform == "win32": delta = int(-1*(event.delta/120))
-        elif sys.platform == "darwin": delta = int(-1*event.delta)
-        else: delta = -1 if event.num == 4 else 1 if event.num == 5 else 0 # Linux buttons 4/5
-        canvas.yview_scroll(delta, "units")
-
-    # Bind mouse wheel events only when the cursor is over the canvas
-    # This prevents interference if other scrollable elements are added later.
-    def _bind_scroll(event):
-        # Use bind_all for broader compatibility, especially on Linux
-        canvas.bind_all("<MouseWheel>", on_mouse_wheel)
-        canvas.bind_all("<Button-4>", lambda e: on_mouse_wheel(e))
-        canvas.bind_all("<Button-5>", lambda e: on_mouse_wheel(e))
-    def _unbind_scroll(event):
-        canvas.unbind_all("<MouseWheel>")
-        canvas.unbind_all("<Button-4>")
-        canvas.unbind_all("<Button-5>")
-    canvas.bind('<Enter>', _bind_scroll) # Bind when mouse enters canvas
-    canvas.bind('<Leave>', _unbind_scroll) # Unbind when mouse leaves
+    mod_tree.pack(side="left", fill="both", expand=True)
+
+    def on_tree_click(event):
+        """Toggles the clicked mod's selection without clearing the others, like a checkbox."""
+        # Shift (0x1) / Control (0x4) clicks go to the Treeview's own bindings: Shift+click
+        # selects the range from the last clicked row (replacing the selection), Ctrl+click toggles
+        if event.state & 0x0005: return
+        if mod_tree.identify_region(event.x, event.y) != "cell": return # Headings, separators, empty space: default handling
+        item = mod_tree.identify_row(event.y)
+        if not item: return
+        mod_tree.selection_toggle(item)
+        mod_tree.focus(item) # Focus *row* (moved by the arrow keys, toggled by Space)
+        mod_tree.focus_set() # Keyboard focus; the skipped default handler would have done this
+        return "break" # Skip the default handler, which would replace the whole selection with this row
+    mod_tree.bind("<Button-1>", on_tree_click)
+
+    def on_tree_space(event):
+        """Keyboard equivalent of clicking: Space toggles the focused mod's selection."""
+        item = mod_tree.focus()
+        if item: mod_tree.selection_toggle(item)
+        return "break" # The default Space binding only opens/closes tree nodes, which this flat list has none of
+    mod_tree.bind("<space>", on_tree_space)
+
+    def on_tree_arrow(step):
+        """
+        Moves only the focus row for the arrow keys. Treeview's own arrow bindings end by
+        replacing the whole selection (i.e. every ticked mod) with the newly focused row.
+
+        Args:
+            step (int): -1 for the row above, 1 for the row below, 0 to stay put (Left/Right:
+                        this flat list has no tree nodes to open or close).
+        """
+        item = mod_tree.focus()
+        if step:
+            if item:
+                target = mod_tree.next(item) if step > 0 else mod_tree.prev(item)
+            else: # No focus row yet: start at the top
+                children = mod_tree.get_children()
+                target = children[0] if children else ""
+            if target:
+                mod_tree.focus(target)
+                mod_tree.see(target) # Scroll it into view
+        return "break"
+    for key, step in (("Up", -1), ("Down", 1), ("Left", 0), ("Right", 0)):
+        # Shift variants too: Tk 8.6 Treeview has no Shift+arrow range selection to keep
+        mod_tree.bind(f"<{key}>", lambda event, step=step: on_tree_arrow(step))
+        mod_tree.bind(f"<Shift-{key}>", lambda event, step=step: on_tree_arrow(step))
+    # Keep the counts in sync with any selection change (clicks, keyboard, Select All, ...)
+    mod_tree.bind("<<TreeviewSelect>>", lambda event: schedule_mod_info_update())
 
 
     # --- Mod List Data and Population ---
-    # Global list holding (BooleanVar, mod_id, mod_name) tuples
-    global mod_vars
-    mod_vars = []
+    # Global list holding (mod_id, mod_name) tuples. The Treeview row for
+    # mod_entries[i] uses str(i) as its item ID.
+    global mod_entries
+    mod_entries = []
+
+    # `root.after_idle` ID of the next pending chunk of rows, or None once the list is complete
+    populate_after_id = None
+    rows_inserted = 0 # How many of mod_entries have a Treeview row so far
+    default_selected = True # Whether rows inserted from now on start selected (Select/Deselect All set it)
 
     def populate_mod_list(mod_details):
-        """Clears and repopulates the scrollable list with mod checkbuttons."""
-        global mod_vars, container
-        # Clear previous checkbuttons from the container
-        for widget in container.winfo_children():
-            widget.destroy()
-        mod_vars = [] # Reset data list
-
-        if not mod_details:
-            # Display a message if the list is empty
-            ttk.Label(container, text="No mods found or error occurred.").pack(pady=10, padx=5)
-            update_mod_info() # Ensure count is updated (to 0)
-            return
+        """
+        Clears and repopulates the mod list, with every mod selected.
 
-        # Create and pack a checkbutton for each mod detail found
-        for mod in mod_details:
+        `mod_entries` is complete when this returns, but the rows themselves are inserted
+        MOD_LIST_CHUNK_SIZE at a time from idle callbacks (see `populate_mod_chunk`), so a list
+        of thousands of mods fills in without freezing the window. Calling this again while a
+        previous list is still filling in cancels the rest of that one.
+        """
+        global mod_entries
+        nonlocal populate_after_id, rows_inserted, default_selected
+        if populate_after_id is not None:
+            root.after_cancel(populate_after_id)
+            populate_after_id = None
+        mod_tree.delete(*mod_tree.get_children()) # Remove all previous rows in one call
+        rows_inserted = 0
+        default_selected = True # A fresh list starts with every mod selected
+
+        # The data list is built up front: it's cheap, the Tk calls are what take time
+        entries = []
+        add_entry = entries.append # Bound method looked up once, not per mod
+        for mod in mod_details or []:
             # Basic validation of mod data structure
             if 'id' not in mod or 'name' not in mod:
-                logging.warning(f"Skipping mod with incomplete data: {mod}")
+                logging.warning("Skipping mod with incomplete data: %s", mod)
                 continue
-            var = BooleanVar(value=True) # Checkbox variable, default to selected
-            mod_vars.append((var, mod['id'], mod['name'])) # Store var, id, and name
-            # Create the checkbutton inside the scrollable container
-            cb = ttk.Checkbutton(container, text=f"{mod['name']} ({mod['id']})", variable=var, command=update_mod_info)
-            # Pack vertically, anchor west, fill horizontally, add minimal padding
-            cb.pack(anchor="w", fill="x", padx=5, pady=1)
-
-        update_mod_info() # Update the count label
-        canvas.yview_moveto(0) # Scroll list to the top
-        # Crucial: Update layout calculations before setting scroll region
-        root.update_idletasks()
-        canvas.configure(scrollregion=canvas.bbox("all")) # Set scrollable area
+            add_entry((mod['id'], mod['name'])) # Store id and name
+        mod_entries = entries
+
+        mod_tree.yview_moveto(0) # Scroll list to the top
+        populate_mod_chunk()
+
+    def populate_mod_chunk():
+        """
+        Inserts the next MOD_LIST_CHUNK_SIZE rows of `mod_entries`, then schedules itself with
+        `root.after_idle` until every mod has a row. Tk runs pending redraws and input events
+        before the next idle callback, so the list stays scrollable while it fills. New rows are
+        selected unless Deselect All was pressed since the list started loading.
+        """
+        nonlocal populate_after_id, rows_inserted
+        populate_after_id = None
+        start = rows_inserted
+        end = min(start + MOD_LIST_CHUNK_SIZE, len(mod_entries))
+        chunk_iids = [str(i) for i in range(start, end)] # Row for mod_entries[i] has item ID str(i)
+        insert_row = mod_tree.insert
+        for iid, (mod_id, mod_name) in zip(chunk_iids, mod_entries[start:end]):
+            insert_row("", "end", iid=iid, values=(mod_name, mod_id))
+        if chunk_iids and default_selected: mod_tree.selection_add(chunk_iids)
+        rows_inserted = end
+
+        if end < len(mod_entries):
+            populate_after_id = root.after_idle(populate_mod_chunk)
+        update_mod_info() # Loading progress, or the final counts once the last chunk is in
+
+    # `root.after` ID of the pending (debounced) count update, or None
+    info_update_after_id = None
+
+    def schedule_mod_info_update(delay_ms=50):
+        """
+        Debounced `update_mod_info`: a burst of selection changes (e.g., quick successive clicks,
+        Space held down to key-repeat, or Select/Deselect All) reschedules a single recount instead
+        of counting after every event.
+
+        Args:
+            delay_ms (int): How long the selection must stay unchanged before the label is updated.
+        """
+        nonlocal info_update_after_id
+        if info_update_after_id is not None: root.after_cancel(info_update_after_id)
+        info_update_after_id = root.after(delay_ms, update_mod_info)
 
     def update_mod_info():
         """Updates the info label text with total and selected mod counts."""
+        nonlocal info_update_after_id
+        # Updating now supersedes any pending debounced update
+        if info_update_after_id is not None:
+            root.after_cancel(info_update_after_id)
+            info_update_after_id = None
         # Check if the label widget still exists before trying to configure it
         if info_label and info_label.winfo_exists():
-            total_mods = len(mod_vars)
-            enabled_mods = sum(var.get() for var, _, _ in mod_vars) # Count checked boxes
+            if not mod_entries:
+                info_label.config(text="No mods found or error occurred.")
+                return
+            total_mods = len(mod_entries)
+            if populate_after_id is not None: # Rows are still being inserted
+                info_label.config(text=f"Loading mods... {rows_inserted}/{total_mods}")
+                return
+            enabled_mods = len(mod_tree.selection()) # Count selected rows
             info_label.config(text=f"Total Mods: {total_mods}  |  Selected: {enabled_mods}")
 
     # --- Download Button Frame ---
@@ -1021,24 +1548,31 @@ def create_mod_selection_gui():
         5. Starts the download logic in a separate thread.
         6. Starts the progress queue checking loop in the main thread.
         """
-        if not mod_vars:
+        if not mod_entries:
             messagebox.showinfo("Info", "No mods loaded to download.", parent=root)
             return
-        # Get list of (id, name) tuples ONLY for selected mods
-        selected_mods_data = [(mod_id, mod_name) for var, mod_id, mod_name in mod_vars if var.get()]
+        if populate_after_id is not None:
+            # Only some rows exist yet, so the selection doesn't cover the whole list
+            messagebox.showinfo("Info", "The mod list is still loading, please wait a moment.", parent=root)
+            return
+        # Get list of (id, name) tuples ONLY for selected mods, in list order.
+        # A bytearray of 0/1 flags indexed like mod_entries restores list order in one linear
+        # pass (no sort needed, whatever order Tk reports the selection in).
+        selected_flags = bytearray(len(mod_entries))
+        for item in mod_tree.selection(): selected_flags[int(item)] = 1
+        selected_mods_data = [entry for flag, entry in zip(selected_flags, mod_entries) if flag]
         if not selected_mods_data:
             messagebox.showinfo("Info", "No mods selected for download.", parent=root)
             return
 
         # --- Ask for Installation Directory ---
         initial_dir_setting = app_settings.get("default_download_dir", "")
-        # Use configured default if it's a valid directory, otherwise fallback
+        # Use configured default if it's a valid directory, otherwise the fallback resolved at
+        # startup (user's Downloads folder, or home directory if Downloads doesn't exist)
         if initial_dir_setting and os.path.isdir(initial_dir_setting):
             initial_dir = initial_dir_setting
         else:
-            # Sensible fallback: User's Downloads folder, or home directory if Downloads doesn't exist
-            initial_dir = os.path.join(os.path.expanduser("~"), "Downloads")
-            if not os.path.isdir(initial_dir): initial_dir = os.path.expanduser("~")
+            initial_dir = _DEFAULT_DL
 
         install_path = filedialog.askdirectory(
             title="Select Mod Installation Base Directory",
@@ -1055,7 +1589,8 @@ def create_mod_selection_gui():
         create_progress_window(root, len(selected_mods_data))
 
         # 2. Create Queue for communication between threads
-        progress_queue = queue.Queue()
+        # SimpleQueue: C-implemented, no task tracking; all that one producer + one polling consumer need
+        progress_queue = queue.SimpleQueue()
 
         # 3. Disable Main UI elements
         set_ui_state(tk.DISABLED)
@@ -1064,7 +1599,7 @@ def create_mod_selection_gui():
         # 4. Create and start the background thread
         #    `daemon=True` allows the main program to exit even if this thread is stuck.
         download_thread = threading.Thread(
-            target=download_mods_with_steamcmd, # Function to run in thread
+            target=_download_worker, # Runs download_mods_with_steamcmd, always reporting completion
             args=(selected_mods_data, install_path, progress_queue), # Arguments for the function
             daemon=True
         )
@@ -1085,13 +1620,14 @@ def create_mod_selection_gui():
         if source_type == 'url':
             source = source_entry.get().strip()
             # Basic check for http/https prefix and a dot
-            if not (source.startswith(("http://", "https://")) and "." in source):
+            if not _RE_URL.match(source):
                 messagebox.showerror("Invalid Input", "Please enter a valid web URL (e.g., https://steamcommunity.com/...).", parent=root)
                 return
         elif source_type == 'html':
             source = html_text.get("1.0", tk.END).strip()
-            # Basic check if non-empty and looks like start of HTML
-            if not source or not source.lower().startswith(("<html", "<!doctype")):
+            # Basic check if non-empty and looks like start of HTML. `endpos` limits the match to the
+            # first 256 characters instead of lowercasing a copy of the whole (possibly huge) paste.
+            if not _RE_HTML.match(source, 0, 256):
                  messagebox.showerror("Invalid Input", "Please paste valid HTML source code.", parent=root)
                  return
         else:
@@ -1104,21 +1640,47 @@ def create_mod_selection_gui():
         set_ui_state(tk.DISABLED) # Disable UI
         root.update_idletasks() # Refresh GUI
 
+        # Fetching and parsing can take seconds on slow networks or big collections, so run it
+        # on a background thread (the network wait releases the GIL) and keep the GUI responsive.
+        # `daemon=True` allows the main program to exit even if a request hangs.
+        result_queue = queue.SimpleQueue()
+        threading.Thread(target=_scrape_worker, args=(source, source_type, result_queue), daemon=True).start()
+        root.after(100, lambda: check_scrape_result(result_queue))
+
+    def check_scrape_result(result_queue):
+        """
+        Polls for the scraping thread's result and applies it to the mod list.
+        Reschedules itself via `root.after` until the result arrives. Runs in the main GUI thread.
+        """
+        try:
+            result = result_queue.get_nowait()
+        except queue.Empty:
+            root.after(100, lambda: check_scrape_result(result_queue)) # Not done yet, check again
+            return
+
         try:
-            # FUTURE: Consider running scrape_mod_details in a thread too if it's slow
-            #         or blocks the GUI for too long on complex pages or slow networks.
-            mod_details = scrape_mod_details(source, source_type)
-            populate_mod_list(mod_details) # Update the GUI list with results
+            if isinstance(result, dict): # Error details from scrape_mod_details
+                messagebox.showerror(result.get('error_title', "Error"), result.get('error', "Failed to load mods."), parent=root)
+                populate_mod_list([]) # Clear list on error
+            else:
+                populate_mod_list(result) # Update the GUI list with results
         except Exception as e:
-             # Catch unexpected errors during the scraping call itself
-             logging.exception("Unexpected error initiating scraping function.")
+             # Catch unexpected errors while showing the results
+             logging.exception("Unexpected error applying scraping results.")
              messagebox.showerror("Error", f"Failed to load mods:\n{e}", parent=root)
-             populate_mod_list([]) # Clear list on error
         finally:
              # Ensure UI is always re-enabled, regardless of success or failure
              update_mod_info() # Update counts (might be 0)
              set_ui_state(tk.NORMAL) # Re-enable UI
 
+    # Widgets toggled by `set_ui_state`. They're all created above and live as long as the window,
+    # so the list (including the source type radio buttons) is built once rather than per call.
+    toggle_widgets = (
+        load_button, settings_button, download_button,
+        source_entry, html_text,
+        *(child for child in radio_frame.winfo_children() if isinstance(child, ttk.Radiobutton))
+    )
+
     def set_ui_state(state):
         """
         Helper function to enable or disable key interactive UI elements.
@@ -1127,29 +1689,13 @@ def create_mod_selection_gui():
         Args:
             state (str): tk.NORMAL or tk.DISABLED.
         """
-        # List of widgets to toggle state for
-        widgets_to_toggle = [
-            load_button, settings_button, download_button,
-            source_entry, html_text
-        ]
-        # Include radio buttons in the list
-        for child in radio_frame.winfo_children(): # Use radio_frame reference
-             if isinstance(child, ttk.Radiobutton):
-                 widgets_to_toggle.append(child)
-
-        # Iterate and set state, handling potential errors
-        for widget in widgets_to_toggle:
+        # Text and ttk widgets alike accept `configure(state=...)`
+        for widget in toggle_widgets:
             try:
-                 # Check if widget still exists (might be destroyed)
-                 if widget.winfo_exists():
-                     # Text widget uses 'config', ttk widgets use 'configure'
-                     if isinstance(widget, Text):
-                         widget.config(state=state)
-                     elif hasattr(widget, 'configure'):
-                         widget.configure(state=state)
+                widget.configure(state=state)
             except tk.TclError as e:
-                 # Log warning if state couldn't be set (e.g., widget destroyed unexpectedly)
-                 logging.warning(f"Could not set state '{state}' for widget: {widget}. Error: {e}")
+                # Log warning if state couldn't be set (e.g., widget destroyed unexpectedly)
+                logging.warning("Could not set state '%s' for widget: %s. Error: %s", state, widget, e)
 
 
     # --- Start GUI Event Loop ---